@@ -10,8 +10,20 @@ import json
 import logging
 import datetime
 import glob
+import hashlib
+import io
 from pathlib import Path
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:  # Optional; the stdlib parser is used when it isn't installed
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -24,6 +36,201 @@ logging.basicConfig(
 )
 logger = logging.getLogger("fs_final_report_generation")
 
+# Bullet points with severity markers, e.g. "- **High**: finding text"
+_SEVERITY_PATTERN = re.compile(r"[-*]\s+\*\*(High|Medium|Low|Critical)\*\*:\s+(.*?)(?=\n[-*]|\n\n|\Z)", re.DOTALL)
+_SEVERITY_ORDER = {"Critical": 0, "High": 1, "Medium": 2, "Low": 3}
+# Body of each level 2/3 section, used to quote the leading sections of a summary
+_KEY_SECTIONS_PATTERN = re.compile(r"(?:^|\n)#{2,3}\s+(.+?)(?:\n#{2,3}|\Z)", re.DOTALL)
+# Upper bound on the threads each section uses to load its JSON inputs (see _bulk_load)
+_MAX_LOAD_WORKERS = 8
+
+
+def _parse_json(data):
+    """Parse JSON bytes, preferring orjson when it is available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (e.g. NaN, huge ints); let json decide
+            pass
+    # json accepts bytes directly, skipping a separate text decode
+    return json.loads(data)
+
+
+@lru_cache(maxsize=256)
+def _read_text(file_path, mtime_ns, size):
+    """
+    Read and decode a text file. The mtime and size are part of the cache key,
+    so a file that changes on disk is read again.
+    """
+    content = Path(file_path).read_bytes().decode("utf-8", "replace")
+    # Match text-mode universal newlines
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+@lru_cache(maxsize=256)
+def _key_findings(content, max_findings):
+    """Return the top severity-marked findings in content, most severe first."""
+    # Every severity marker contains "**:", so most files can be ruled out with
+    # one substring search before running the regex
+    if "**:" not in content:
+        return ()
+    
+    # Look for bullet points with severity markers
+    matches = _SEVERITY_PATTERN.findall(content)
+    
+    # Sort by severity (Critical > High > Medium > Low)
+    ranked = [(_SEVERITY_ORDER.get(severity, 4), severity, finding) for severity, finding in matches]
+    ranked.sort(key=itemgetter(0))
+    
+    # Take top findings based on severity
+    return tuple(f"**{severity}**: {finding.strip()}" for _, severity, finding in ranked[:max_findings])
+
+# Heading keywords looked up by the section extractors
+_SECTION_TAGS = {
+    "summary": "Summary",
+    "findings": "Findings",
+    "failed": "Failed",
+    "metrics": "Metrics",
+    "bottlenecks": "Bottleneck",
+    "scenarios": "Scenarios",
+    "vulnerabilities": "Vulnerabilit",
+    "recommendations": "Recommendations",
+    "dependencies": "Dependenc",
+}
+
+
+def _first_heading(content):
+    """Return the (start, end) of the first level 2/3 heading mark in content, or None."""
+    hashes = content.find("##")
+    while hashes >= 0:
+        if hashes == 0 or content[hashes - 1] == "\n":
+            end = hashes + 3 if content.startswith("#", hashes + 2) else hashes + 2
+            if content[end:end + 1].isspace():
+                return max(hashes - 1, 0), end
+        hashes = content.find("##", hashes + 1)
+    return None
+
+
+def _extract_sections(content, *kinds):
+    r"""
+    Extract the sections for several _SECTION_TAGS kinds from content.
+    Each kind maps to the text of r"(?:^|\n)#{2,3}\s+.*<tag>.*?(?:\n#{2,3}|\Z)" (DOTALL),
+    or None when there is no such match. Headings and tags are literal, so plain
+    str.find/rfind scans do the work of the regex engine.
+    """
+    heading = _first_heading(content)
+    sections = {}
+    for kind in kinds:
+        tag = _SECTION_TAGS[kind]
+        tag_start = content.rfind(tag) if heading else -1
+        if tag_start <= (heading[1] if heading else 0):
+            sections[kind] = None
+            continue
+        end = content.find("\n##", tag_start + len(tag))
+        if end < 0:
+            end = len(content)
+        else:
+            end += 4 if content.startswith("#", end + 3) else 3
+        sections[kind] = content[heading[0]:end]
+    return sections
+
+# Filename keywords the sections look for, classified once per directory scan
+_FILE_TAGS = {
+    "summary": ("summary",),
+    "report": ("report",),
+    "depend": ("depend",),
+    "api_route": ("api", "route"),
+}
+
+# Static report text, written verbatim
+_STATIC_ANALYSIS_RECOMMENDATIONS = (
+    "### Recommendations\n\n"
+    "Based on the static analysis results, we recommend:\n\n"
+    "1. Address identified code quality issues, particularly focusing on high-severity findings\n"
+    "2. Implement consistent error handling patterns across all services\n"
+    "3. Reduce code duplication in utility functions\n"
+    "4. Consider implementing a linting pre-commit hook to maintain code quality\n"
+    "5. Document complex algorithms and business logic more thoroughly\n\n"
+)
+_ELEMENT_MAPPING_RECOMMENDATIONS = (
+    "### Recommendations\n\n"
+    "Based on the element mapping results, we recommend:\n\n"
+    "1. Document service dependencies more explicitly in code and configuration\n"
+    "2. Consider implementing API versioning for better backward compatibility\n"
+    "3. Standardize error response formats across all API endpoints\n"
+    "4. Implement comprehensive API documentation using OpenAPI/Swagger\n"
+    "5. Review circular dependencies between components and consider refactoring\n\n"
+)
+_PRECISION_TESTING_RECOMMENDATIONS = (
+    "### Recommendations\n\n"
+    "Based on the precision testing results, we recommend:\n\n"
+    "1. Implement more robust input validation across all API endpoints\n"
+    "2. Add comprehensive error handling for edge cases identified in testing\n"
+    "3. Improve state management for user sessions and transactions\n"
+    "4. Implement retry mechanisms for transient failures\n"
+    "5. Add more comprehensive logging for debugging and monitoring\n\n"
+)
+_PERFORMANCE_RECOMMENDATIONS = (
+    "### Recommendations\n\n"
+    "Based on the performance analysis results, we recommend:\n\n"
+    "1. Implement database query optimization for identified slow queries\n"
+    "2. Add caching mechanisms for frequently accessed data\n"
+    "3. Consider horizontal scaling for services under high load\n"
+    "4. Implement connection pooling for database connections\n"
+    "5. Set up performance monitoring and alerting for production deployment\n\n"
+)
+_CHAOS_TESTING_RECOMMENDATIONS = (
+    "### Recommendations\n\n"
+    "Based on the chaos testing results, we recommend:\n\n"
+    "1. Implement circuit breakers for critical service dependencies\n"
+    "2. Add retry mechanisms with exponential backoff for transient failures\n"
+    "3. Implement graceful degradation for non-critical features\n"
+    "4. Enhance monitoring and alerting for system failures\n"
+    "5. Document recovery procedures for various failure scenarios\n\n"
+)
+_SECURITY_RECOMMENDATIONS = (
+    "### Recommendations\n\n"
+    "Based on the security assessment results, we recommend:\n\n"
+    "1. Implement proper input validation and output encoding to prevent injection attacks\n"
+    "2. Enhance authentication mechanisms with multi-factor authentication\n"
+    "3. Implement proper CORS policies and security headers\n"
+    "4. Use parameterized queries for all database operations\n"
+    "5. Implement rate limiting to prevent brute force attacks\n"
+    "6. Conduct regular security audits and penetration testing\n\n"
+)
+_ACCESSIBILITY_RECOMMENDATIONS = (
+    "### Recommendations\n\n"
+    "Based on the accessibility and usability assessment, we recommend:\n\n"
+    "1. Implement consistent API naming conventions across all services\n"
+    "2. Enhance API documentation with clear examples and error responses\n"
+    "3. Add pagination and filtering capabilities to list endpoints\n"
+    "4. Standardize error response formats for better developer experience\n"
+    "5. Consider implementing an API style guide for future development\n\n"
+)
+_CONCLUSION_SECTION = (
+    "## Conclusion and Next Steps\n\n"
+    "The surgical-precision testing of Future Social (FS) has revealed a solid foundation with several areas for improvement before production deployment. The modular architecture and clear separation of concerns provide a good basis for future development and scaling.\n\n"
+    "### Priority Recommendations\n\n"
+    "Based on the comprehensive testing results, we recommend the following high-priority actions:\n\n"
+    "1. **Security Enhancements**: Address identified vulnerabilities, particularly in authentication and input validation\n"
+    "2. **Performance Optimization**: Implement caching and query optimization for identified bottlenecks\n"
+    "3. **Resilience Improvements**: Add circuit breakers and retry mechanisms for critical service dependencies\n"
+    "4. **Documentation**: Enhance API documentation with examples and error handling\n"
+    "5. **Monitoring**: Implement comprehensive monitoring and alerting for production deployment\n\n"
+    "### Next Steps\n\n"
+    "To move forward with the Future Social platform, we recommend the following next steps:\n\n"
+    "1. Prioritize and address the findings based on severity and impact\n"
+    "2. Implement automated testing pipelines for continuous quality assurance\n"
+    "3. Conduct user acceptance testing with a focus on the AI sandbox functionality\n"
+    "4. Develop a phased deployment strategy with monitoring and rollback capabilities\n"
+    "5. Establish regular security and performance testing cadence for ongoing maintenance\n\n"
+    "This surgical-precision testing report provides a comprehensive assessment of the Future Social platform's current state and offers actionable recommendations for improvement. By addressing these findings, the platform can achieve greater stability, security, and user satisfaction.\n\n"
+)
+
+
 class SurgicalReportGenerator:
     def __init__(self):
         self.project_root = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -43,216 +250,282 @@ class SurgicalReportGenerator:
         self.security_dir = self.test_results_dir / "security_tests"
         self.accessibility_dir = self.test_results_dir / "accessibility_usability_tests"
         
+        # Cached section output keyed by input directory state, see _generate_cached_section
+        self.cache_dir = self.test_results_dir / ".cache"
+        
+        # Per-directory scan results, see _scan_dir
+        self._scan_cache = {}
+        
         logger.info("Final Surgical Report Generator initialized.")
 
     def _load_json(self, file_path):
         """Load JSON data from a file."""
         try:
-            if Path(file_path).exists():
-                with open(file_path, "r") as f:
-                    return json.load(f)
-            else:
-                logger.warning(f"File not found: {file_path}")
-                return {}
+            return _parse_json(Path(file_path).read_bytes())
+        except FileNotFoundError:
+            logger.warning(f"File not found: {file_path}")
+            return {}
         except Exception as e:
             logger.error(f"Error loading {file_path}: {e}")
             return {}
 
+    def _bulk_load(self, paths):
+        """Load the JSON files among paths concurrently, keyed by path."""
+        json_paths = [p for p in paths if p.suffix == ".json"]
+        if len(json_paths) < 2:
+            return {p: self._load_json(p) for p in json_paths}
+        with ThreadPoolExecutor(max_workers=min(len(json_paths), _MAX_LOAD_WORKERS)) as executor:
+            return dict(zip(json_paths, executor.map(self._load_json, json_paths)))
+
     def _read_file_content(self, file_path):
         """Read content from a file."""
         try:
-            if Path(file_path).exists():
-                with open(file_path, "r", encoding="utf-8") as f:
-                    return f.read()
-            else:
-                logger.warning(f"File not found: {file_path}")
-                return ""
+            stat = os.stat(file_path)
+            return _read_text(str(file_path), stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            logger.warning(f"File not found: {file_path}")
+            return ""
         except Exception as e:
             logger.error(f"Error reading {file_path}: {e}")
             return ""
 
-    def _find_files(self, directory, pattern="*"):
-        """Find files matching a pattern in a directory."""
+    def _scan_dir(self, directory):
+        """
+        Return the (json_files, md_files, tagged) in a directory from a single scan.
+        tagged maps each name in _FILE_TAGS to the files whose name carries that tag.
+        """
+        directory = str(directory)
+        if directory in self._scan_cache:
+            return self._scan_cache[directory]
+        
+        json_files, md_files = [], []
         try:
-            if Path(directory).exists():
-                return list(Path(directory).glob(pattern))
-            else:
-                logger.warning(f"Directory not found: {directory}")
-                return []
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith(".") or not entry.is_file():
+                        continue
+                    if name.endswith(".json"):
+                        json_files.append(Path(entry.path))
+                    elif name.endswith(".md"):
+                        md_files.append(Path(entry.path))
+        except FileNotFoundError:
+            logger.warning(f"Directory not found: {directory}")
         except Exception as e:
             logger.error(f"Error finding files in {directory}: {e}")
-            return []
-
-    def _extract_key_findings(self, content, max_findings=5):
-        """Extract key findings from a report content."""
-        findings = []
         
-        # Look for bullet points with severity markers
-        severity_pattern = r"[-*]\s+\*\*(High|Medium|Low|Critical)\*\*:\s+(.*?)(?=\n[-*]|\n\n|\Z)"
-        matches = re.findall(severity_pattern, content, re.DOTALL)
+        # Classify every file once, JSON before Markdown as the sections expect
+        tagged = {tag: [] for tag in _FILE_TAGS}
+        for path in json_files + md_files:
+            name = path.name.lower()
+            for tag, keywords in _FILE_TAGS.items():
+                if all(keyword in name for keyword in keywords):
+                    tagged[tag].append(path)
+        
+        # Result directories don't change during a run
+        self._scan_cache[directory] = (json_files, md_files, tagged)
+        return json_files, md_files, tagged
+
+    def _count_entries(self, directory, suffix=""):
+        """Count the non-hidden entries in a directory, optionally by suffix."""
+        try:
+            with os.scandir(directory) as entries:
+                return sum(1 for entry in entries
+                           if not entry.name.startswith(".") and entry.name.endswith(suffix))
+        except FileNotFoundError:
+            return 0
+
+    def _directory_stamp(self, directory):
+        """Hash the (name, mtime, size) manifest of a directory and of this script."""
+        manifest = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.name.startswith("."):
+                        stat = entry.stat()
+                        manifest.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            pass
+        manifest.sort()
+        # Include the generator itself so code changes invalidate the cache
+        script_stat = os.stat(__file__)
+        manifest.append((__file__, script_stat.st_mtime_ns, script_stat.st_size))
+        return hashlib.sha256(repr(manifest).encode("utf-8")).hexdigest()
+
+    def _generate_cached_section(self, generator, directory, out):
+        """Write a section into out, reusing the cached copy if its inputs are unchanged."""
+        name = generator.__name__
+        cached_path = self.cache_dir / f"{name}.md"
+        stamp_path = self.cache_dir / f"{name}.stamp"
+        stamp = self._directory_stamp(directory)
         
-        # Sort by severity (Critical > High > Medium > Low)
-        severity_order = {"Critical": 0, "High": 1, "Medium": 2, "Low": 3}
-        sorted_matches = sorted(matches, key=lambda x: severity_order.get(x[0], 4))
+        try:
+            if stamp_path.read_text(encoding="utf-8") == stamp:
+                out.write(cached_path.read_text(encoding="utf-8"))
+                logger.info(f"Reusing cached {name} output")
+                return
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache for {name}: {e}")
         
-        # Take top findings based on severity
-        for severity, finding in sorted_matches[:max_findings]:
-            findings.append(f"**{severity}**: {finding.strip()}")
+        buf = io.StringIO()
+        generator(buf)
+        content = buf.getvalue()
+        out.write(content)
         
-        return findings
+        try:
+            self.cache_dir.mkdir(exist_ok=True, parents=True)
+            cached_path.write_text(content, encoding="utf-8")
+            stamp_path.write_text(stamp, encoding="utf-8")
+        except Exception as e:
+            logger.warning(f"Could not cache {name} output: {e}")
+
+    def _extract_key_findings(self, content, max_findings=5):
+        """Extract key findings from a report content."""
+        return list(_key_findings(content, max_findings))
 
-    def generate_executive_summary(self):
-        """Generate the executive summary section of the report."""
+    def generate_executive_summary(self, out):
+        """Generate the executive summary section of the report into out."""
         logger.info("Generating executive summary...")
         
-        summary = []
-        summary.append("# Surgical-Precision Testing Report: Future Social (FS)")
-        summary.append(f"\nGenerated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        w = out.write
+        w("# Surgical-Precision Testing Report: Future Social (FS)\n")
+        w(f"\nGenerated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
         
-        summary.append("## Executive Summary\n")
-        summary.append("This report presents the findings from a comprehensive surgical-precision testing audit of the Future Social (FS) platform. The testing methodology followed a systematic approach, examining the codebase and architecture with precision and thoroughness.\n")
+        w("## Executive Summary\n\n")
+        w("This report presents the findings from a comprehensive surgical-precision testing audit of the Future Social (FS) platform. The testing methodology followed a systematic approach, examining the codebase and architecture with precision and thoroughness.\n\n")
         
         # Count test files and results
-        test_files = len(list(self.test_env_dir.glob("*.py")))
-        result_files = sum(len(list(d.glob("*"))) for d in [self.static_analysis_dir, self.element_mapping_dir, 
-                                                          self.precision_tests_dir, self.performance_dir, 
-                                                          self.chaos_dir, self.security_dir, 
-                                                          self.accessibility_dir] if d.exists())
-        
-        summary.append(f"The audit encompassed {test_files} distinct test procedures, generating {result_files} result artifacts across seven testing domains:\n")
-        summary.append("1. **Static Code Analysis**: Examining code quality, patterns, and potential issues")
-        summary.append("2. **Element Mapping**: Cataloging all system components and their interactions")
-        summary.append("3. **Precision Testing**: Validating input handling and state management")
-        summary.append("4. **Performance Analysis**: Evaluating system efficiency and scalability")
-        summary.append("5. **Chaos Engineering**: Testing system resilience under adverse conditions")
-        summary.append("6. **Security Assessment**: Identifying vulnerabilities and protection mechanisms")
-        summary.append("7. **Accessibility & Usability**: Evaluating API design and documentation quality\n")
+        test_files = self._count_entries(self.test_env_dir, ".py")
+        result_files = sum(self._count_entries(d) for d in [self.static_analysis_dir, self.element_mapping_dir, 
+                                                            self.precision_tests_dir, self.performance_dir, 
+                                                            self.chaos_dir, self.security_dir, 
+                                                            self.accessibility_dir])
+        
+        w(f"The audit encompassed {test_files} distinct test procedures, generating {result_files} result artifacts across seven testing domains:\n\n")
+        w("1. **Static Code Analysis**: Examining code quality, patterns, and potential issues\n")
+        w("2. **Element Mapping**: Cataloging all system components and their interactions\n")
+        w("3. **Precision Testing**: Validating input handling and state management\n")
+        w("4. **Performance Analysis**: Evaluating system efficiency and scalability\n")
+        w("5. **Chaos Engineering**: Testing system resilience under adverse conditions\n")
+        w("6. **Security Assessment**: Identifying vulnerabilities and protection mechanisms\n")
+        w("7. **Accessibility & Usability**: Evaluating API design and documentation quality\n\n")
         
         # Overall assessment
-        summary.append("### Overall Assessment\n")
-        summary.append("The Future Social platform demonstrates a solid architectural foundation with modular microservices and clear separation of concerns. The testing revealed both strengths in the system design and opportunities for enhancement before production deployment.\n")
+        w("### Overall Assessment\n\n")
+        w("The Future Social platform demonstrates a solid architectural foundation with modular microservices and clear separation of concerns. The testing revealed both strengths in the system design and opportunities for enhancement before production deployment.\n\n")
         
         # Key strengths
-        summary.append("#### Key Strengths\n")
-        summary.append("- **Modular Architecture**: Well-separated services with clear responsibilities")
-        summary.append("- **API Design**: Consistent RESTful API patterns across services")
-        summary.append("- **Testing Coverage**: Comprehensive unit tests for core functionality")
-        summary.append("- **AI Integration**: Innovative AI sandbox with personalization capabilities")
-        summary.append("- **Security Awareness**: Basic security considerations present in authentication flows\n")
+        w("#### Key Strengths\n\n")
+        w("- **Modular Architecture**: Well-separated services with clear responsibilities\n")
+        w("- **API Design**: Consistent RESTful API patterns across services\n")
+        w("- **Testing Coverage**: Comprehensive unit tests for core functionality\n")
+        w("- **AI Integration**: Innovative AI sandbox with personalization capabilities\n")
+        w("- **Security Awareness**: Basic security considerations present in authentication flows\n\n")
         
         # Critical findings placeholder - will be populated later
-        summary.append("#### Critical Findings\n")
-        summary.append("*The most significant findings are summarized below and detailed in subsequent sections.*\n")
-        
-        return "\n".join(summary)
+        w("#### Critical Findings\n\n")
+        w("*The most significant findings are summarized below and detailed in subsequent sections.*\n\n")
 
-    def generate_static_analysis_section(self):
-        """Generate the static code analysis section of the report."""
+    def generate_static_analysis_section(self, out):
+        """Generate the static code analysis section of the report into out."""
         logger.info("Generating static code analysis section...")
         
-        section = []
-        section.append("## Static Code Analysis\n")
+        w = out.write
+        w("## Static Code Analysis\n\n")
         
         # Look for static analysis results
-        static_analysis_files = self._find_files(self.static_analysis_dir, "*.json") + self._find_files(self.static_analysis_dir, "*.md")
+        json_files, md_files, tagged = self._scan_dir(self.static_analysis_dir)
+        static_analysis_files = json_files + md_files
         
         if not static_analysis_files:
-            section.append("*Static code analysis results not found or incomplete.*\n")
-            return "\n".join(section)
+            w("*Static code analysis results not found or incomplete.*\n\n")
+            return
         
         # Process static analysis results
-        section.append("The static code analysis examined code quality, patterns, and potential issues using automated tools.\n")
+        w("The static code analysis examined code quality, patterns, and potential issues using automated tools.\n\n")
         
         # Try to find summary files first
-        summary_files = [f for f in static_analysis_files if "summary" in f.name.lower()]
+        summary_files = tagged["summary"]
+        loaded = self._bulk_load(summary_files or static_analysis_files[:3])
         if summary_files:
             for summary_file in summary_files:
                 if summary_file.suffix == ".json":
-                    data = self._load_json(summary_file)
+                    data = loaded[summary_file]
                     if data:
-                        section.append(f"### {data.get('title', 'Analysis Results')}\n")
-                        section.append(f"{data.get('description', '')}\n")
+                        w(f"### {data.get('title', 'Analysis Results')}\n\n")
+                        w(f"{data.get('description', '')}\n\n")
                         
                         findings = data.get("findings", [])
                         if findings:
-                            section.append("#### Key Findings\n")
+                            w("#### Key Findings\n\n")
                             for finding in findings[:5]:  # Top 5 findings
-                                section.append(f"- **{finding.get('severity', 'Issue')}**: {finding.get('message', '')}")
+                                w(f"- **{finding.get('severity', 'Issue')}**: {finding.get('message', '')}\n")
                                 if "recommendation" in finding:
-                                    section.append(f"  - *Recommendation*: {finding.get('recommendation')}")
-                            section.append("")
+                                    w(f"  - *Recommendation*: {finding.get('recommendation')}\n")
+                            w("\n")
                 elif summary_file.suffix == ".md":
                     content = self._read_file_content(summary_file)
                     if content:
                         # Extract and include relevant sections
-                        key_sections = re.findall(r"(?:^|\n)#{2,3}\s+(.+?)(?:\n#{2,3}|\Z)", content, re.DOTALL)
-                        for section_content in key_sections[:2]:  # First 2 major sections
-                            section.append(section_content.strip())
-                            section.append("")
+                        key_sections = _KEY_SECTIONS_PATTERN.findall(content)
+                        w("".join(f"{section_content.strip()}\n\n" for section_content in key_sections[:2]))  # First 2 major sections
         else:
             # If no summary files, try to extract information from individual result files
             for result_file in static_analysis_files[:3]:  # Limit to first 3 files
                 if result_file.suffix == ".json":
-                    data = self._load_json(result_file)
+                    data = loaded[result_file]
                     if data:
-                        section.append(f"### Analysis from {result_file.stem}\n")
+                        w(f"### Analysis from {result_file.stem}\n\n")
                         # Extract key metrics or findings based on file structure
                         if isinstance(data, dict):
                             if "summary" in data:
-                                section.append(f"{data['summary']}\n")
+                                w(f"{data['summary']}\n\n")
                             elif "issues" in data:
-                                section.append(f"Found {len(data['issues'])} potential issues.\n")
-                                for issue in data['issues'][:3]:  # Top 3 issues
-                                    section.append(f"- {issue.get('message', 'Issue')} ({issue.get('severity', 'unknown')})")
+                                w(f"Found {len(data['issues'])} potential issues.\n\n")
+                                w("".join(f"- {issue.get('message', 'Issue')} ({issue.get('severity', 'unknown')})\n" for issue in data['issues'][:3]))  # Top 3 issues
                         elif isinstance(data, list) and len(data) > 0:
-                            section.append(f"Found {len(data)} items.\n")
-                            for item in data[:3]:  # Top 3 items
-                                if isinstance(item, dict):
-                                    section.append(f"- {item.get('message', str(item))}")
+                            w(f"Found {len(data)} items.\n\n")
+                            w("".join(f"- {item.get('message', str(item))}\n" for item in data[:3] if isinstance(item, dict)))  # Top 3 items
                 elif result_file.suffix == ".md":
                     content = self._read_file_content(result_file)
                     findings = self._extract_key_findings(content)
                     if findings:
-                        section.append(f"### Findings from {result_file.stem}\n")
-                        for finding in findings:
-                            section.append(f"- {finding}")
-                        section.append("")
+                        w(f"### Findings from {result_file.stem}\n\n")
+                        w("".join(f"- {finding}\n" for finding in findings))
+                        w("\n")
         
         # Add recommendations
-        section.append("### Recommendations\n")
-        section.append("Based on the static analysis results, we recommend:\n")
-        section.append("1. Address identified code quality issues, particularly focusing on high-severity findings")
-        section.append("2. Implement consistent error handling patterns across all services")
-        section.append("3. Reduce code duplication in utility functions")
-        section.append("4. Consider implementing a linting pre-commit hook to maintain code quality")
-        section.append("5. Document complex algorithms and business logic more thoroughly\n")
-        
-        return "\n".join(section)
-
-    def generate_element_mapping_section(self):
-        """Generate the element mapping section of the report."""
+        w(_STATIC_ANALYSIS_RECOMMENDATIONS)
+
+    def generate_element_mapping_section(self, out):
+        """Generate the element mapping section of the report into out."""
         logger.info("Generating element mapping section...")
         
-        section = []
-        section.append("## System Element Mapping\n")
+        w = out.write
+        w("## System Element Mapping\n\n")
         
         # Look for element mapping results
-        mapping_files = self._find_files(self.element_mapping_dir, "*.json") + self._find_files(self.element_mapping_dir, "*.md")
+        json_files, md_files, tagged = self._scan_dir(self.element_mapping_dir)
+        mapping_files = json_files + md_files
         
         if not mapping_files:
-            section.append("*Element mapping results not found or incomplete.*\n")
-            return "\n".join(section)
+            w("*Element mapping results not found or incomplete.*\n\n")
+            return
         
         # Process element mapping results
-        section.append("The element mapping process cataloged all system components, their interactions, and dependencies.\n")
+        w("The element mapping process cataloged all system components, their interactions, and dependencies.\n\n")
         
         # Try to find API routes mapping
-        api_routes_file = next((f for f in mapping_files if "api" in f.name.lower() and "route" in f.name.lower()), None)
+        api_routes_file = next(iter(tagged["api_route"]), None)
+        dependencies_file = next(iter(tagged["depend"]), None)
+        loaded = self._bulk_load([f for f in (api_routes_file, dependencies_file) if f])
         if api_routes_file and api_routes_file.suffix == ".json":
-            data = self._load_json(api_routes_file)
+            data = loaded[api_routes_file]
             if data:
-                section.append("### API Routes\n")
-                section.append("The system exposes the following key API endpoints:\n")
+                w("### API Routes\n\n")
+                w("The system exposes the following key API endpoints:\n\n")
                 
                 # Group by service
                 services = {}
@@ -263,578 +536,486 @@ class SurgicalReportGenerator:
                     services[service].append(route)
                 
                 for service, routes in services.items():
-                    section.append(f"#### {service.capitalize()} Service\n")
+                    w(f"#### {service.capitalize()} Service\n\n")
                     for route in routes[:5]:  # Top 5 routes per service
                         method = route.get("method", "GET").upper()
                         path = route.get("path", "/")
                         description = route.get("description", "")
-                        section.append(f"- `{method} {path}` - {description}")
+                        w(f"- `{method} {path}` - {description}\n")
                     if len(routes) > 5:
-                        section.append(f"- *...and {len(routes) - 5} more endpoints*")
-                    section.append("")
+                        w(f"- *...and {len(routes) - 5} more endpoints*\n")
+                    w("\n")
         
         # Try to find component dependencies
-        dependencies_file = next((f for f in mapping_files if "depend" in f.name.lower()), None)
         if dependencies_file:
             if dependencies_file.suffix == ".json":
-                data = self._load_json(dependencies_file)
+                data = loaded[dependencies_file]
                 if data:
-                    section.append("### Component Dependencies\n")
-                    section.append("The system has the following key component dependencies:\n")
+                    w("### Component Dependencies\n\n")
+                    w("The system has the following key component dependencies:\n\n")
                     
                     if isinstance(data, dict):
-                        for component, deps in list(data.items())[:5]:  # Top 5 components
-                            section.append(f"- **{component}** depends on: {', '.join(deps[:3])}")
+                        for component, deps in islice(data.items(), 5):  # Top 5 components
+                            w(f"- **{component}** depends on: {', '.join(deps[:3])}\n")
                             if len(deps) > 3:
-                                section.append(f"  - *...and {len(deps) - 3} more dependencies*")
+                                w(f"  - *...and {len(deps) - 3} more dependencies*\n")
                     elif isinstance(data, list):
-                        for dep in data[:5]:  # Top 5 dependencies
-                            if isinstance(dep, dict) and "source" in dep and "target" in dep:
-                                section.append(f"- **{dep['source']}** → **{dep['target']}**")
-                    section.append("")
+                        w("".join(f"- **{dep['source']}** → **{dep['target']}**\n" for dep in data[:5] if isinstance(dep, dict) and "source" in dep and "target" in dep))  # Top 5 dependencies
+                    w("\n")
             elif dependencies_file.suffix == ".md":
                 content = self._read_file_content(dependencies_file)
+                sections = _extract_sections(content, "dependencies")
                 # Extract dependency section if it exists
-                dependency_section = re.search(r"(?:^|\n)#{2,3}\s+.*Dependenc.*?(?:\n#{2,3}|\Z)", content, re.DOTALL)
+                dependency_section = sections["dependencies"]
                 if dependency_section:
-                    section.append(dependency_section.group(0).strip())
-                    section.append("")
+                    w(f"{dependency_section.strip()}\n\n")
         
         # Add recommendations
-        section.append("### Recommendations\n")
-        section.append("Based on the element mapping results, we recommend:\n")
-        section.append("1. Document service dependencies more explicitly in code and configuration")
-        section.append("2. Consider implementing API versioning for better backward compatibility")
-        section.append("3. Standardize error response formats across all API endpoints")
-        section.append("4. Implement comprehensive API documentation using OpenAPI/Swagger")
-        section.append("5. Review circular dependencies between components and consider refactoring\n")
-        
-        return "\n".join(section)
-
-    def generate_precision_testing_section(self):
-        """Generate the precision testing section of the report."""
+        w(_ELEMENT_MAPPING_RECOMMENDATIONS)
+
+    def generate_precision_testing_section(self, out):
+        """Generate the precision testing section of the report into out."""
         logger.info("Generating precision testing section...")
         
-        section = []
-        section.append("## Precision Testing\n")
+        w = out.write
+        w("## Precision Testing\n\n")
         
         # Look for precision testing results
-        precision_files = self._find_files(self.precision_tests_dir, "*.json") + self._find_files(self.precision_tests_dir, "*.md")
+        json_files, md_files, tagged = self._scan_dir(self.precision_tests_dir)
+        precision_files = json_files + md_files
         
         if not precision_files:
-            section.append("*Precision testing results not found or incomplete.*\n")
-            return "\n".join(section)
+            w("*Precision testing results not found or incomplete.*\n\n")
+            return
         
         # Process precision testing results
-        section.append("Precision testing evaluated input handling, state management, and edge cases across the system.\n")
+        w("Precision testing evaluated input handling, state management, and edge cases across the system.\n\n")
         
         # Try to find summary files first
-        summary_files = [f for f in precision_files if "summary" in f.name.lower()]
+        summary_files = tagged["summary"]
+        loaded = self._bulk_load(summary_files or precision_files[:3])
         if summary_files:
             for summary_file in summary_files:
                 if summary_file.suffix == ".json":
-                    data = self._load_json(summary_file)
+                    data = loaded[summary_file]
                     if data:
-                        section.append(f"### {data.get('title', 'Test Results')}\n")
-                        section.append(f"{data.get('description', '')}\n")
+                        w(f"### {data.get('title', 'Test Results')}\n\n")
+                        w(f"{data.get('description', '')}\n\n")
                         
                         test_results = data.get("results", [])
                         if test_results:
-                            passed = sum(1 for r in test_results if r.get("status") == "pass")
-                            failed = sum(1 for r in test_results if r.get("status") == "fail")
-                            skipped = sum(1 for r in test_results if r.get("status") == "skip")
+                            status_counts = Counter(r.get("status") for r in test_results)
+                            passed, failed, skipped = status_counts["pass"], status_counts["fail"], status_counts["skip"]
                             
-                            section.append(f"**Summary**: {passed} passed, {failed} failed, {skipped} skipped\n")
+                            w(f"**Summary**: {passed} passed, {failed} failed, {skipped} skipped\n\n")
                             
                             if failed > 0:
-                                section.append("#### Failed Tests\n")
-                                for result in test_results:
-                                    if result.get("status") == "fail":
-                                        section.append(f"- **{result.get('name', 'Unnamed test')}**: {result.get('message', 'No details')}")
-                                section.append("")
+                                w("#### Failed Tests\n\n")
+                                w("".join(f"- **{result.get('name', 'Unnamed test')}**: {result.get('message', 'No details')}\n" for result in test_results if result.get("status") == "fail"))
+                                w("\n")
                 elif summary_file.suffix == ".md":
                     content = self._read_file_content(summary_file)
                     if content:
+                        sections = _extract_sections(content, "summary", "failed")
                         # Extract summary section
-                        summary_section = re.search(r"(?:^|\n)#{2,3}\s+.*Summary.*?(?:\n#{2,3}|\Z)", content, re.DOTALL)
+                        summary_section = sections["summary"]
                         if summary_section:
-                            section.append(summary_section.group(0).strip())
-                            section.append("")
+                            w(f"{summary_section.strip()}\n\n")
                         
                         # Extract failed tests section
-                        failed_section = re.search(r"(?:^|\n)#{2,3}\s+.*Failed.*?(?:\n#{2,3}|\Z)", content, re.DOTALL)
+                        failed_section = sections["failed"]
                         if failed_section:
-                            section.append(failed_section.group(0).strip())
-                            section.append("")
+                            w(f"{failed_section.strip()}\n\n")
         else:
             # If no summary files, try to extract information from individual result files
             for result_file in precision_files[:3]:  # Limit to first 3 files
                 if result_file.suffix == ".json":
-                    data = self._load_json(result_file)
+                    data = loaded[result_file]
                     if data:
-                        section.append(f"### Results from {result_file.stem}\n")
+                        w(f"### Results from {result_file.stem}\n\n")
                         # Extract key metrics or findings based on file structure
                         if isinstance(data, dict):
                             if "summary" in data:
-                                section.append(f"{data['summary']}\n")
+                                w(f"{data['summary']}\n\n")
                             elif "results" in data:
                                 results = data["results"]
                                 if isinstance(results, list):
-                                    passed = sum(1 for r in results if r.get("status") == "pass")
-                                    failed = sum(1 for r in results if r.get("status") == "fail")
-                                    section.append(f"**Summary**: {passed} passed, {failed} failed\n")
+                                    status_counts = Counter(r.get("status") for r in results)
+                                    passed, failed = status_counts["pass"], status_counts["fail"]
+                                    w(f"**Summary**: {passed} passed, {failed} failed\n\n")
                                     
                                     if failed > 0:
-                                        section.append("#### Failed Tests\n")
-                                        for result in results[:3]:  # Top 3 failures
-                                            if result.get("status") == "fail":
-                                                section.append(f"- **{result.get('name', 'Unnamed test')}**: {result.get('message', 'No details')}")
-                                        section.append("")
+                                        w("#### Failed Tests\n\n")
+                                        w("".join(f"- **{result.get('name', 'Unnamed test')}**: {result.get('message', 'No details')}\n" for result in results[:3] if result.get("status") == "fail"))  # Top 3 failures
+                                        w("\n")
                 elif result_file.suffix == ".md":
                     content = self._read_file_content(result_file)
                     findings = self._extract_key_findings(content)
                     if findings:
-                        section.append(f"### Findings from {result_file.stem}\n")
-                        for finding in findings:
-                            section.append(f"- {finding}")
-                        section.append("")
+                        w(f"### Findings from {result_file.stem}\n\n")
+                        w("".join(f"- {finding}\n" for finding in findings))
+                        w("\n")
         
         # Add recommendations
-        section.append("### Recommendations\n")
-        section.append("Based on the precision testing results, we recommend:\n")
-        section.append("1. Implement more robust input validation across all API endpoints")
-        section.append("2. Add comprehensive error handling for edge cases identified in testing")
-        section.append("3. Improve state management for user sessions and transactions")
-        section.append("4. Implement retry mechanisms for transient failures")
-        section.append("5. Add more comprehensive logging for debugging and monitoring\n")
-        
-        return "\n".join(section)
-
-    def generate_performance_section(self):
-        """Generate the performance testing section of the report."""
+        w(_PRECISION_TESTING_RECOMMENDATIONS)
+
+    def generate_performance_section(self, out):
+        """Generate the performance testing section of the report into out."""
         logger.info("Generating performance testing section...")
         
-        section = []
-        section.append("## Performance Analysis\n")
+        w = out.write
+        w("## Performance Analysis\n\n")
         
         # Look for performance testing results
-        performance_files = self._find_files(self.performance_dir, "*.json") + self._find_files(self.performance_dir, "*.md")
+        json_files, md_files, tagged = self._scan_dir(self.performance_dir)
+        performance_files = json_files + md_files
         
         if not performance_files:
-            section.append("*Performance testing results not found or incomplete.*\n")
-            return "\n".join(section)
+            w("*Performance testing results not found or incomplete.*\n\n")
+            return
         
         # Process performance testing results
-        section.append("Performance analysis evaluated system efficiency, response times, and scalability under various loads.\n")
+        w("Performance analysis evaluated system efficiency, response times, and scalability under various loads.\n\n")
         
         # Try to find summary files first
-        summary_files = [f for f in performance_files if "summary" in f.name.lower()]
+        summary_files = tagged["summary"]
+        loaded = self._bulk_load(summary_files or performance_files[:3])
         if summary_files:
             for summary_file in summary_files:
                 if summary_file.suffix == ".json":
-                    data = self._load_json(summary_file)
+                    data = loaded[summary_file]
                     if data:
-                        section.append(f"### {data.get('title', 'Performance Results')}\n")
-                        section.append(f"{data.get('description', '')}\n")
+                        w(f"### {data.get('title', 'Performance Results')}\n\n")
+                        w(f"{data.get('description', '')}\n\n")
                         
                         metrics = data.get("metrics", {})
                         if metrics:
-                            section.append("#### Key Metrics\n")
-                            for name, value in metrics.items():
-                                section.append(f"- **{name}**: {value}")
-                            section.append("")
+                            w("#### Key Metrics\n\n")
+                            w("".join(f"- **{name}**: {value}\n" for name, value in metrics.items()))
+                            w("\n")
                         
                         bottlenecks = data.get("bottlenecks", [])
                         if bottlenecks:
-                            section.append("#### Identified Bottlenecks\n")
+                            w("#### Identified Bottlenecks\n\n")
                             for bottleneck in bottlenecks:
-                                section.append(f"- **{bottleneck.get('component', 'Unknown')}**: {bottleneck.get('description', '')}")
+                                w(f"- **{bottleneck.get('component', 'Unknown')}**: {bottleneck.get('description', '')}\n")
                                 if "recommendation" in bottleneck:
-                                    section.append(f"  - *Recommendation*: {bottleneck.get('recommendation')}")
-                            section.append("")
+                                    w(f"  - *Recommendation*: {bottleneck.get('recommendation')}\n")
+                            w("\n")
                 elif summary_file.suffix == ".md":
                     content = self._read_file_content(summary_file)
                     if content:
+                        sections = _extract_sections(content, "metrics", "bottlenecks")
                         # Extract metrics section
-                        metrics_section = re.search(r"(?:^|\n)#{2,3}\s+.*Metrics.*?(?:\n#{2,3}|\Z)", content, re.DOTALL)
+                        metrics_section = sections["metrics"]
                         if metrics_section:
-                            section.append(metrics_section.group(0).strip())
-                            section.append("")
+                            w(f"{metrics_section.strip()}\n\n")
                         
                         # Extract bottlenecks section
-                        bottlenecks_section = re.search(r"(?:^|\n)#{2,3}\s+.*Bottleneck.*?(?:\n#{2,3}|\Z)", content, re.DOTALL)
+                        bottlenecks_section = sections["bottlenecks"]
                         if bottlenecks_section:
-                            section.append(bottlenecks_section.group(0).strip())
-                            section.append("")
+                            w(f"{bottlenecks_section.strip()}\n\n")
         else:
             # If no summary files, try to extract information from individual result files
             for result_file in performance_files[:3]:  # Limit to first 3 files
                 if result_file.suffix == ".json":
-                    data = self._load_json(result_file)
+                    data = loaded[result_file]
                     if data:
-                        section.append(f"### Results from {result_file.stem}\n")
+                        w(f"### Results from {result_file.stem}\n\n")
                         # Extract key metrics or findings based on file structure
                         if isinstance(data, dict):
                             if "summary" in data:
-                                section.append(f"{data['summary']}\n")
+                                w(f"{data['summary']}\n\n")
                             elif "metrics" in data:
                                 metrics = data["metrics"]
                                 if isinstance(metrics, dict):
-                                    section.append("#### Key Metrics\n")
-                                    for name, value in list(metrics.items())[:5]:  # Top 5 metrics
-                                        section.append(f"- **{name}**: {value}")
-                                    section.append("")
+                                    w("#### Key Metrics\n\n")
+                                    w("".join(f"- **{name}**: {value}\n" for name, value in islice(metrics.items(), 5)))  # Top 5 metrics
+                                    w("\n")
                 elif result_file.suffix == ".md":
                     content = self._read_file_content(result_file)
                     findings = self._extract_key_findings(content)
                     if findings:
-                        section.append(f"### Findings from {result_file.stem}\n")
-                        for finding in findings:
-                            section.append(f"- {finding}")
-                        section.append("")
+                        w(f"### Findings from {result_file.stem}\n\n")
+                        w("".join(f"- {finding}\n" for finding in findings))
+                        w("\n")
         
         # Add recommendations
-        section.append("### Recommendations\n")
-        section.append("Based on the performance analysis results, we recommend:\n")
-        section.append("1. Implement database query optimization for identified slow queries")
-        section.append("2. Add caching mechanisms for frequently accessed data")
-        section.append("3. Consider horizontal scaling for services under high load")
-        section.append("4. Implement connection pooling for database connections")
-        section.append("5. Set up performance monitoring and alerting for production deployment\n")
-        
-        return "\n".join(section)
-
-    def generate_chaos_testing_section(self):
-        """Generate the chaos testing section of the report."""
+        w(_PERFORMANCE_RECOMMENDATIONS)
+
+    def generate_chaos_testing_section(self, out):
+        """Generate the chaos testing section of the report into out."""
         logger.info("Generating chaos testing section...")
         
-        section = []
-        section.append("## Chaos Engineering\n")
+        w = out.write
+        w("## Chaos Engineering\n\n")
         
         # Look for chaos testing results
-        chaos_files = self._find_files(self.chaos_dir, "*.json") + self._find_files(self.chaos_dir, "*.md")
+        json_files, md_files, tagged = self._scan_dir(self.chaos_dir)
+        chaos_files = json_files + md_files
         
         if not chaos_files:
-            section.append("*Chaos testing results not found or incomplete.*\n")
-            return "\n".join(section)
+            w("*Chaos testing results not found or incomplete.*\n\n")
+            return
         
         # Process chaos testing results
-        section.append("Chaos engineering tested system resilience under adverse conditions, including component failures and network issues.\n")
+        w("Chaos engineering tested system resilience under adverse conditions, including component failures and network issues.\n\n")
         
         # Try to find summary files first
-        summary_files = [f for f in chaos_files if "summary" in f.name.lower()]
+        summary_files = tagged["summary"]
+        loaded = self._bulk_load(summary_files or chaos_files[:3])
         if summary_files:
             for summary_file in summary_files:
                 if summary_file.suffix == ".json":
-                    data = self._load_json(summary_file)
+                    data = loaded[summary_file]
                     if data:
-                        section.append(f"### {data.get('title', 'Chaos Test Results')}\n")
-                        section.append(f"{data.get('description', '')}\n")
+                        w(f"### {data.get('title', 'Chaos Test Results')}\n\n")
+                        w(f"{data.get('description', '')}\n\n")
                         
                         scenarios = data.get("scenarios", [])
                         if scenarios:
-                            section.append("#### Test Scenarios\n")
+                            w("#### Test Scenarios\n\n")
                             for scenario in scenarios:
                                 result = scenario.get("result", "unknown")
                                 name = scenario.get("name", "Unnamed scenario")
                                 description = scenario.get("description", "")
-                                section.append(f"- **{name}** ({result}): {description}")
+                                w(f"- **{name}** ({result}): {description}\n")
                                 if "findings" in scenario:
-                                    for finding in scenario["findings"][:2]:  # Top 2 findings per scenario
-                                        section.append(f"  - {finding}")
-                            section.append("")
+                                    w("".join(f"  - {finding}\n" for finding in scenario["findings"][:2]))  # Top 2 findings per scenario
+                            w("\n")
                 elif summary_file.suffix == ".md":
                     content = self._read_file_content(summary_file)
                     if content:
+                        sections = _extract_sections(content, "scenarios", "findings")
                         # Extract scenarios section
-                        scenarios_section = re.search(r"(?:^|\n)#{2,3}\s+.*Scenarios.*?(?:\n#{2,3}|\Z)", content, re.DOTALL)
+                        scenarios_section = sections["scenarios"]
                         if scenarios_section:
-                            section.append(scenarios_section.group(0).strip())
-                            section.append("")
+                            w(f"{scenarios_section.strip()}\n\n")
                         
                         # Extract findings section
-                        findings_section = re.search(r"(?:^|\n)#{2,3}\s+.*Findings.*?(?:\n#{2,3}|\Z)", content, re.DOTALL)
+                        findings_section = sections["findings"]
                         if findings_section:
-                            section.append(findings_section.group(0).strip())
-                            section.append("")
+                            w(f"{findings_section.strip()}\n\n")
         else:
             # If no summary files, try to extract information from individual result files
             for result_file in chaos_files[:3]:  # Limit to first 3 files
                 if result_file.suffix == ".json":
-                    data = self._load_json(result_file)
+                    data = loaded[result_file]
                     if data:
-                        section.append(f"### Results from {result_file.stem}\n")
+                        w(f"### Results from {result_file.stem}\n\n")
                         # Extract key metrics or findings based on file structure
                         if isinstance(data, dict):
                             if "summary" in data:
-                                section.append(f"{data['summary']}\n")
+                                w(f"{data['summary']}\n\n")
                             elif "scenarios" in data:
                                 scenarios = data["scenarios"]
                                 if isinstance(scenarios, list):
-                                    section.append("#### Test Scenarios\n")
-                                    for scenario in scenarios[:3]:  # Top 3 scenarios
-                                        if isinstance(scenario, dict):
-                                            result = scenario.get("result", "unknown")
-                                            name = scenario.get("name", "Unnamed scenario")
-                                            section.append(f"- **{name}** ({result})")
-                                    section.append("")
+                                    w("#### Test Scenarios\n\n")
+                                    w("".join(f"- **{scenario.get('name', 'Unnamed scenario')}** ({scenario.get('result', 'unknown')})\n"
+                                              for scenario in scenarios[:3] if isinstance(scenario, dict)))  # Top 3 scenarios
+                                    w("\n")
                 elif result_file.suffix == ".md":
                     content = self._read_file_content(result_file)
                     findings = self._extract_key_findings(content)
                     if findings:
-                        section.append(f"### Findings from {result_file.stem}\n")
-                        for finding in findings:
-                            section.append(f"- {finding}")
-                        section.append("")
+                        w(f"### Findings from {result_file.stem}\n\n")
+                        w("".join(f"- {finding}\n" for finding in findings))
+                        w("\n")
         
         # Add recommendations
-        section.append("### Recommendations\n")
-        section.append("Based on the chaos testing results, we recommend:\n")
-        section.append("1. Implement circuit breakers for critical service dependencies")
-        section.append("2. Add retry mechanisms with exponential backoff for transient failures")
-        section.append("3. Implement graceful degradation for non-critical features")
-        section.append("4. Enhance monitoring and alerting for system failures")
-        section.append("5. Document recovery procedures for various failure scenarios\n")
-        
-        return "\n".join(section)
-
-    def generate_security_section(self):
-        """Generate the security testing section of the report."""
+        w(_CHAOS_TESTING_RECOMMENDATIONS)
+
+    def generate_security_section(self, out):
+        """Generate the security testing section of the report into out."""
         logger.info("Generating security testing section...")
         
-        section = []
-        section.append("## Security Assessment\n")
+        w = out.write
+        w("## Security Assessment\n\n")
         
         # Look for security testing results
-        security_files = self._find_files(self.security_dir, "*.json") + self._find_files(self.security_dir, "*.md")
+        json_files, md_files, tagged = self._scan_dir(self.security_dir)
+        security_files = json_files + md_files
         
         if not security_files:
-            section.append("*Security testing results not found or incomplete.*\n")
-            return "\n".join(section)
+            w("*Security testing results not found or incomplete.*\n\n")
+            return
         
         # Process security testing results
-        section.append("Security assessment identified vulnerabilities and evaluated protection mechanisms across the system.\n")
+        w("Security assessment identified vulnerabilities and evaluated protection mechanisms across the system.\n\n")
         
         # Try to find security report file
-        report_file = next((f for f in security_files if "report" in f.name.lower()), None)
+        report_file = next(iter(tagged["report"]), None)
         if report_file and report_file.suffix == ".md":
             content = self._read_file_content(report_file)
             if content:
+                sections = _extract_sections(content, "summary", "vulnerabilities")
                 # Extract summary section
-                summary_section = re.search(r"(?:^|\n)#{2,3}\s+.*Summary.*?(?:\n#{2,3}|\Z)", content, re.DOTALL)
+                summary_section = sections["summary"]
                 if summary_section:
-                    section.append(summary_section.group(0).strip())
-                    section.append("")
+                    w(f"{summary_section.strip()}\n\n")
                 
                 # Extract vulnerabilities section
-                vulns_section = re.search(r"(?:^|\n)#{2,3}\s+.*Vulnerabilit.*?(?:\n#{2,3}|\Z)", content, re.DOTALL)
+                vulns_section = sections["vulnerabilities"]
                 if vulns_section:
-                    section.append(vulns_section.group(0).strip())
-                    section.append("")
+                    w(f"{vulns_section.strip()}\n\n")
                 elif not summary_section:
                     # If no specific sections found, extract key findings
                     findings = self._extract_key_findings(content)
                     if findings:
-                        section.append("### Key Security Findings\n")
-                        for finding in findings:
-                            section.append(f"- {finding}")
-                        section.append("")
+                        w("### Key Security Findings\n\n")
+                        w("".join(f"- {finding}\n" for finding in findings))
+                        w("\n")
         else:
             # Try to find individual test result files
+            loaded = self._bulk_load(security_files[:3])
             for result_file in security_files[:3]:  # Limit to first 3 files
                 if result_file.suffix == ".json":
-                    data = self._load_json(result_file)
+                    data = loaded[result_file]
                     if data:
-                        section.append(f"### Results from {result_file.stem}\n")
+                        w(f"### Results from {result_file.stem}\n\n")
                         # Extract key metrics or findings based on file structure
                         if isinstance(data, dict):
                             if "summary" in data:
-                                section.append(f"{data['summary']}\n")
+                                w(f"{data['summary']}\n\n")
                             elif "vulnerabilities" in data:
                                 vulns = data["vulnerabilities"]
                                 if isinstance(vulns, list):
-                                    section.append("#### Identified Vulnerabilities\n")
-                                    for vuln in vulns[:5]:  # Top 5 vulnerabilities
-                                        if isinstance(vuln, dict):
-                                            severity = vuln.get("severity", "Unknown")
-                                            name = vuln.get("name", "Unnamed vulnerability")
-                                            description = vuln.get("description", "")
-                                            section.append(f"- **{severity}**: {name} - {description}")
-                                    section.append("")
+                                    w("#### Identified Vulnerabilities\n\n")
+                                    w("".join(f"- **{vuln.get('severity', 'Unknown')}**: {vuln.get('name', 'Unnamed vulnerability')} - {vuln.get('description', '')}\n"
+                                              for vuln in vulns[:5] if isinstance(vuln, dict)))  # Top 5 vulnerabilities
+                                    w("\n")
                 elif result_file.suffix == ".md" and result_file != report_file:
                     content = self._read_file_content(result_file)
                     findings = self._extract_key_findings(content)
                     if findings:
-                        section.append(f"### Findings from {result_file.stem}\n")
-                        for finding in findings:
-                            section.append(f"- {finding}")
-                        section.append("")
+                        w(f"### Findings from {result_file.stem}\n\n")
+                        w("".join(f"- {finding}\n" for finding in findings))
+                        w("\n")
         
         # Add recommendations
-        section.append("### Recommendations\n")
-        section.append("Based on the security assessment results, we recommend:\n")
-        section.append("1. Implement proper input validation and output encoding to prevent injection attacks")
-        section.append("2. Enhance authentication mechanisms with multi-factor authentication")
-        section.append("3. Implement proper CORS policies and security headers")
-        section.append("4. Use parameterized queries for all database operations")
-        section.append("5. Implement rate limiting to prevent brute force attacks")
-        section.append("6. Conduct regular security audits and penetration testing\n")
-        
-        return "\n".join(section)
-
-    def generate_accessibility_section(self):
-        """Generate the accessibility and usability section of the report."""
+        w(_SECURITY_RECOMMENDATIONS)
+
+    def generate_accessibility_section(self, out):
+        """Generate the accessibility and usability section of the report into out."""
         logger.info("Generating accessibility and usability section...")
         
-        section = []
-        section.append("## Accessibility & Usability\n")
+        w = out.write
+        w("## Accessibility & Usability\n\n")
         
         # Look for accessibility testing results
-        accessibility_files = self._find_files(self.accessibility_dir, "*.json") + self._find_files(self.accessibility_dir, "*.md")
+        json_files, md_files, tagged = self._scan_dir(self.accessibility_dir)
+        accessibility_files = json_files + md_files
         
         if not accessibility_files:
-            section.append("*Accessibility and usability testing results not found or incomplete.*\n")
-            return "\n".join(section)
+            w("*Accessibility and usability testing results not found or incomplete.*\n\n")
+            return
         
         # Process accessibility testing results
-        section.append("Accessibility and usability assessment evaluated API design and documentation quality from a developer perspective.\n")
+        w("Accessibility and usability assessment evaluated API design and documentation quality from a developer perspective.\n\n")
         
         # Try to find accessibility report file
-        report_file = next((f for f in accessibility_files if "report" in f.name.lower()), None)
+        report_file = next(iter(tagged["report"]), None)
         if report_file and report_file.suffix == ".md":
             content = self._read_file_content(report_file)
             if content:
+                sections = _extract_sections(content, "summary", "findings", "recommendations")
                 # Extract summary section
-                summary_section = re.search(r"(?:^|\n)#{2,3}\s+.*Summary.*?(?:\n#{2,3}|\Z)", content, re.DOTALL)
+                summary_section = sections["summary"]
                 if summary_section:
-                    section.append(summary_section.group(0).strip())
-                    section.append("")
+                    w(f"{summary_section.strip()}\n\n")
                 
                 # Extract findings section
-                findings_section = re.search(r"(?:^|\n)#{2,3}\s+.*Findings.*?(?:\n#{2,3}|\Z)", content, re.DOTALL)
+                findings_section = sections["findings"]
                 if findings_section:
-                    section.append(findings_section.group(0).strip())
-                    section.append("")
+                    w(f"{findings_section.strip()}\n\n")
                 
                 # Extract recommendations section
-                recommendations_section = re.search(r"(?:^|\n)#{2,3}\s+.*Recommendations.*?(?:\n#{2,3}|\Z)", content, re.DOTALL)
+                recommendations_section = sections["recommendations"]
                 if recommendations_section:
-                    section.append(recommendations_section.group(0).strip())
-                    section.append("")
+                    w(f"{recommendations_section.strip()}\n\n")
                 elif not summary_section and not findings_section:
                     # If no specific sections found, extract key findings
                     findings = self._extract_key_findings(content)
                     if findings:
-                        section.append("### Key Accessibility & Usability Findings\n")
-                        for finding in findings:
-                            section.append(f"- {finding}")
-                        section.append("")
+                        w("### Key Accessibility & Usability Findings\n\n")
+                        w("".join(f"- {finding}\n" for finding in findings))
+                        w("\n")
         else:
             # Try to find individual test result files
+            loaded = self._bulk_load(accessibility_files[:3])
             for result_file in accessibility_files[:3]:  # Limit to first 3 files
                 if result_file.suffix == ".json":
-                    data = self._load_json(result_file)
+                    data = loaded[result_file]
                     if data:
-                        section.append(f"### Results from {result_file.stem}\n")
+                        w(f"### Results from {result_file.stem}\n\n")
                         # Extract key metrics or findings based on file structure
                         if isinstance(data, dict):
                             if "summary" in data:
-                                section.append(f"{data['summary']}\n")
+                                w(f"{data['summary']}\n\n")
                             elif "findings" in data:
                                 findings = data["findings"]
                                 if isinstance(findings, list):
-                                    section.append("#### Key Findings\n")
-                                    for finding in findings[:5]:  # Top 5 findings
-                                        if isinstance(finding, dict):
-                                            severity = finding.get("severity", "Unknown")
-                                            issue = finding.get("issue", "Unnamed issue")
-                                            recommendation = finding.get("recommendation", "")
-                                            section.append(f"- **{severity}**: {issue}")
-                                            if recommendation:
-                                                section.append(f"  - *Recommendation*: {recommendation}")
-                                    section.append("")
+                                    w("#### Key Findings\n\n")
+                                    w("".join(f"- **{finding.get('severity', 'Unknown')}**: {finding.get('issue', 'Unnamed issue')}\n"
+                                              + (f"  - *Recommendation*: {finding['recommendation']}\n" if finding.get("recommendation") else "")
+                                              for finding in findings[:5] if isinstance(finding, dict)))  # Top 5 findings
+                                    w("\n")
                 elif result_file.suffix == ".md" and result_file != report_file:
                     content = self._read_file_content(result_file)
                     findings = self._extract_key_findings(content)
                     if findings:
-                        section.append(f"### Findings from {result_file.stem}\n")
-                        for finding in findings:
-                            section.append(f"- {finding}")
-                        section.append("")
+                        w(f"### Findings from {result_file.stem}\n\n")
+                        w("".join(f"- {finding}\n" for finding in findings))
+                        w("\n")
         
         # Add recommendations if not already included
         if not report_file:
-            section.append("### Recommendations\n")
-            section.append("Based on the accessibility and usability assessment, we recommend:\n")
-            section.append("1. Implement consistent API naming conventions across all services")
-            section.append("2. Enhance API documentation with clear examples and error responses")
-            section.append("3. Add pagination and filtering capabilities to list endpoints")
-            section.append("4. Standardize error response formats for better developer experience")
-            section.append("5. Consider implementing an API style guide for future development\n")
-        
-        return "\n".join(section)
-
-    def generate_conclusion_section(self):
-        """Generate the conclusion section of the report."""
+            w(_ACCESSIBILITY_RECOMMENDATIONS)
+
+    def generate_conclusion_section(self, out):
+        """Generate the conclusion section of the report into out."""
         logger.info("Generating conclusion section...")
         
-        section = []
-        section.append("## Conclusion and Next Steps\n")
-        
-        section.append("The surgical-precision testing of Future Social (FS) has revealed a solid foundation with several areas for improvement before production deployment. The modular architecture and clear separation of concerns provide a good basis for future development and scaling.\n")
-        
-        section.append("### Priority Recommendations\n")
-        section.append("Based on the comprehensive testing results, we recommend the following high-priority actions:\n")
-        section.append("1. **Security Enhancements**: Address identified vulnerabilities, particularly in authentication and input validation")
-        section.append("2. **Performance Optimization**: Implement caching and query optimization for identified bottlenecks")
-        section.append("3. **Resilience Improvements**: Add circuit breakers and retry mechanisms for critical service dependencies")
-        section.append("4. **Documentation**: Enhance API documentation with examples and error handling")
-        section.append("5. **Monitoring**: Implement comprehensive monitoring and alerting for production deployment\n")
-        
-        section.append("### Next Steps\n")
-        section.append("To move forward with the Future Social platform, we recommend the following next steps:\n")
-        section.append("1. Prioritize and address the findings based on severity and impact")
-        section.append("2. Implement automated testing pipelines for continuous quality assurance")
-        section.append("3. Conduct user acceptance testing with a focus on the AI sandbox functionality")
-        section.append("4. Develop a phased deployment strategy with monitoring and rollback capabilities")
-        section.append("5. Establish regular security and performance testing cadence for ongoing maintenance\n")
-        
-        section.append("This surgical-precision testing report provides a comprehensive assessment of the Future Social platform's current state and offers actionable recommendations for improvement. By addressing these findings, the platform can achieve greater stability, security, and user satisfaction.\n")
-        
-        return "\n".join(section)
+        out.write(_CONCLUSION_SECTION)
 
     def generate_final_report(self):
         """Generate the comprehensive final report."""
         logger.info("Generating comprehensive final report...")
         
         try:
-            # Generate each section
-            executive_summary = self.generate_executive_summary()
-            static_analysis = self.generate_static_analysis_section()
-            element_mapping = self.generate_element_mapping_section()
-            precision_testing = self.generate_precision_testing_section()
-            performance = self.generate_performance_section()
-            chaos_testing = self.generate_chaos_testing_section()
-            security = self.generate_security_section()
-            accessibility = self.generate_accessibility_section()
-            conclusion = self.generate_conclusion_section()
-            
-            # Combine all sections
-            report_content = "\n\n".join([
-                executive_summary,
-                static_analysis,
-                element_mapping,
-                precision_testing,
-                performance,
-                chaos_testing,
-                security,
-                accessibility,
-                conclusion
-            ])
+            # Sections are independent and I/O-bound, so build them concurrently,
+            # each into its own buffer; the report file is only opened (and
+            # truncated) once every section has succeeded
+            # Sections backed by a results directory are served from the on-disk
+            # cache when that directory is unchanged
+            section_generators = [
+                (self.generate_executive_summary, None),
+                (self.generate_static_analysis_section, self.static_analysis_dir),
+                (self.generate_element_mapping_section, self.element_mapping_dir),
+                (self.generate_precision_testing_section, self.precision_tests_dir),
+                (self.generate_performance_section, self.performance_dir),
+                (self.generate_chaos_testing_section, self.chaos_dir),
+                (self.generate_security_section, self.security_dir),
+                (self.generate_accessibility_section, self.accessibility_dir),
+                (self.generate_conclusion_section, None)
+            ]
+            buffers = [io.StringIO() for _ in section_generators]
+            with ThreadPoolExecutor(max_workers=len(section_generators)) as executor:
+                futures = [
+                    executor.submit(self._generate_cached_section, generator, directory, buf)
+                    if directory else executor.submit(generator, buf)
+                    for (generator, directory), buf in zip(section_generators, buffers)
+                ]
+                for future in futures:
+                    future.result()
             
-            # Write the report to file
-            with open(self.final_report_path, "w", encoding="utf-8") as f:
-                f.write(report_content)
+            with open(self.final_report_path, "w", encoding="utf-8", buffering=1 << 16) as report:
+                for index, buf in enumerate(buffers):
+                    if index:
+                        report.write("\n")
+                    report.write(buf.getvalue())
+                    # Release each section as soon as it has been written out
+                    buf.close()
             
             logger.info(f"Final report generated: {self.final_report_path}")
             return str(self.final_report_path)
@@ -9,14 +9,23 @@ import sys
 import json
 import logging
 import datetime
+import argparse
 import requests
+from requests.adapters import HTTPAdapter
 import random
+from array import array
 import time
 from pathlib import Path
 import concurrent.futures
+import itertools
 import uuid
 import statistics
 
+try:
+    import orjson
+except ImportError:  # Optional; the stdlib json module is used when it isn't installed
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -28,8 +37,65 @@ logging.basicConfig(
 )
 logger = logging.getLogger("fs_performance_testing")
 
+LOAD_LEVELS = [
+    {"users": 5, "duration": 10}, # Light load
+    {"users": 20, "duration": 20}, # Moderate load
+    # {"users": 50, "duration": 30}  # Heavy load - uncomment for more intense testing
+]
+
+_REPORT_TABLE_HEADER = (
+    "| Concurrent Users | Duration (s) | Total Requests | Successful | Failed | Avg Latency (ms) | P95 Latency (ms) | RPS |\n"
+    "|------------------|--------------|----------------|------------|--------|------------------|------------------|-----|\n"
+)
+
+_REPORT_RECOMMENDATIONS = (
+    "## Summary & Recommendations\n\n"
+    "- Review endpoints with high latencies or high failure rates under load.\n"
+    "- Consider optimizing database queries and application logic for critical paths.\n"
+    "- Scale resources appropriately based on expected user load.\n"
+    "- If P95 latency is significantly higher than average, investigate outliers and long-tail responses.\n"
+)
+
+
+def _loads(data):
+    """Parse JSON bytes, preferring orjson when it is available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (e.g. NaN, huge ints); let json decide
+            pass
+    return json.loads(data)
+
+
+def _dumps(obj):
+    """Serialize to indented JSON bytes, preferring orjson when it is available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _latency_stats(latencies):
+    """Return (avg, p95, min, max) for a list of latencies from a single sort."""
+    if not latencies:
+        return 0, 0, 0, 0
+    data = sorted(latencies)
+    n = len(data)
+    p95 = 0
+    if n > 1:
+        # Same interpolation as statistics.quantiles(data, n=100)[94] ('exclusive')
+        m = 95 * (n + 1)
+        j = min(max(m // 100, 1), n - 1)
+        delta = m - j * 100
+        p95 = (data[j - 1] * (100 - delta) + data[j] * delta) / 100
+    return statistics.fmean(data), p95, data[0], data[-1]
+
+
 class PerformanceTester:
-    def __init__(self):
+    def __init__(self, mock_latency=True):
         self.project_root = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         self.test_env_dir = self.project_root / "testing"
         self.test_results_dir = self.test_env_dir / "results"
@@ -44,23 +110,33 @@ class PerformanceTester:
         # Load API routes and scenarios
         self.routes = self._load_json(self.mapping_dir / "api_routes.json")
         self.scenarios = self._load_json(self.journey_dir / "test_scenarios.json")
+        self._defined_route_set = frozenset((r["method"], r["path"]) for r in self.routes)
         
         # Base URL for API tests
         self.base_url = "http://localhost:5000"  # Default for local testing
+        
+        # One pooled session for all requests so connections are kept alive;
+        # the pool is sized so the heaviest load level never waits for a socket
+        max_users = max(level["users"] for level in LOAD_LEVELS)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_users, pool_maxsize=max_users * 4)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
         self.mock_mode = not self._check_services_running()
+        # Without simulated latency, mock runs stress the harness itself rather than sleep
+        self.mock_latency = mock_latency
 
         self.session_data = {
             "auth_token": None, # Will be populated after login
             "user_id": None
         }
         
-        logger.info(f"Performance tester initialized. Mock mode: {self.mock_mode}")
+        logger.info(f"Performance tester initialized. Mock mode: {self.mock_mode}, mock latency: {self.mock_latency}")
 
     def _load_json(self, file_path):
         try:
             if file_path.exists():
-                with open(file_path, 'r') as f:
-                    return json.load(f)
+                return _loads(file_path.read_bytes())
             else:
                 logger.warning(f"File not found: {file_path}")
                 return []
@@ -70,46 +146,49 @@ class PerformanceTester:
 
     def _check_services_running(self):
         try:
-            response = requests.get(f"{self.base_url}/health", timeout=2)
+            response = self._session.get(f"{self.base_url}/health", timeout=2)
             return response.status_code == 200
         except requests.exceptions.RequestException:
             return False
 
-    def _api_request(self, method, path, data=None, headers=None):
+    def _api_request(self, method, path, data=None, headers=None, parse_body=False):
+        # The auth header lives on the session; only per-call extras are passed here.
+        # The body is only decoded when the caller needs it (parse_body=True).
         url = f"{self.base_url}{path}"
-        effective_headers = headers or {}
-        if self.session_data.get("auth_token"):
-            effective_headers["Authorization"] = f"Bearer {self.session_data['auth_token']}"
 
         start_time = time.perf_counter()
         try:
             if self.mock_mode:
-                time.sleep(random.uniform(0.01, 0.05)) # Simulate network latency
+                if self.mock_latency:
+                    time.sleep(random.uniform(0.01, 0.05)) # Simulate network latency
                 status_code = 200
                 if "error" in path.lower(): status_code = 400 # Simple mock error
-                response_json = {"mock_response": True, "path": path, "method": method}
-                if method == "POST" and "login" in path:
-                    response_json["token"] = "mock_token_" + str(uuid.uuid4())[:8]
-                    response_json["user_id"] = 1
-                elif method == "POST" and "register" in path:
-                     response_json["user_id"] = 1
+                response_json = None
+                if parse_body:
+                    response_json = {"mock_response": True, "path": path, "method": method}
+                    if method == "POST" and "login" in path:
+                        response_json["token"] = "mock_token_" + str(uuid.uuid4())[:8]
+                        response_json["user_id"] = 1
+                    elif method == "POST" and "register" in path:
+                         response_json["user_id"] = 1
                 
             else:
-                if method.upper() == "GET":
-                    response = requests.get(url, params=data, headers=effective_headers, timeout=10)
-                elif method.upper() == "POST":
-                    response = requests.post(url, json=data, headers=effective_headers, timeout=10)
-                elif method.upper() == "PUT":
-                    response = requests.put(url, json=data, headers=effective_headers, timeout=10)
-                elif method.upper() == "DELETE":
-                    response = requests.delete(url, headers=effective_headers, timeout=10)
+                method = method.upper()
+                if method == "GET":
+                    response = self._session.request(method, url, params=data, headers=headers, timeout=10)
+                elif method in ("POST", "PUT"):
+                    response = self._session.request(method, url, json=data, headers=headers, timeout=10)
+                elif method == "DELETE":
+                    response = self._session.request(method, url, headers=headers, timeout=10)
                 else:
                     raise ValueError(f"Unsupported HTTP method: {method}")
                 status_code = response.status_code
-                try:
-                    response_json = response.json()
-                except json.JSONDecodeError:
-                    response_json = {"error": "Non-JSON response", "text": response.text[:100]}
+                response_json = None
+                if parse_body:
+                    try:
+                        response_json = response.json()
+                    except json.JSONDecodeError:
+                        response_json = {"error": "Non-JSON response", "text": response.text[:100]}
             
             latency = (time.perf_counter() - start_time) * 1000 # ms
             return {"status_code": status_code, "latency_ms": latency, "response_json": response_json, "error": None}
@@ -118,11 +197,38 @@ class PerformanceTester:
             logger.error(f"API request failed: {method} {path} - {e}")
             return {"status_code": 0, "latency_ms": latency, "response_json": None, "error": str(e)}
 
+    def _timed_request(self, method, path, data=None):
+        """Load-test variant of _api_request: returns (status_code, latency_ms, ok) without parsing the body."""
+        url = f"{self.base_url}{path}"
+
+        start_time = time.perf_counter()
+        try:
+            if self.mock_mode:
+                if self.mock_latency:
+                    time.sleep(random.uniform(0.01, 0.05)) # Simulate network latency
+                status_code = 400 if "error" in path.lower() else 200
+            elif method == "GET":
+                status_code = self._session.request(method, url, params=data, timeout=10).status_code
+            elif method in ("POST", "PUT"):
+                status_code = self._session.request(method, url, json=data, timeout=10).status_code
+            elif method == "DELETE":
+                status_code = self._session.request(method, url, timeout=10).status_code
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+            return status_code, (time.perf_counter() - start_time) * 1000, True
+        except Exception as e:
+            logger.error(f"API request failed: {method} {path} - {e}")
+            return 0, (time.perf_counter() - start_time) * 1000, False
+
+    def _set_auth_token(self, token):
+        self.session_data["auth_token"] = token
+        self._session.headers["Authorization"] = f"Bearer {token}"
+
     def _login_test_user(self):
         # In a real scenario, you would use a pre-defined test user or register one.
         # For simplicity, we'll mock this or use a fixed credential if not in mock_mode.
         if self.mock_mode:
-            self.session_data["auth_token"] = "mock_token_perf_test"
+            self._set_auth_token("mock_token_perf_test")
             self.session_data["user_id"] = 1
             logger.info("Mock login successful for performance testing.")
             return True
@@ -131,9 +237,9 @@ class PerformanceTester:
         # First, try to register the user in case they don't exist
         self._api_request("POST", "/users/register", data=login_payload)
         
-        result = self._api_request("POST", "/users/login", data=login_payload)
+        result = self._api_request("POST", "/users/login", data=login_payload, parse_body=True)
         if result["status_code"] == 200 and result["response_json"].get("token"):
-            self.session_data["auth_token"] = result["response_json"]["token"]
+            self._set_auth_token(result["response_json"]["token"])
             self.session_data["user_id"] = result["response_json"].get("user_id",1)
             logger.info(f"Login successful for performance testing. User ID: {self.session_data['user_id']}")
             return True
@@ -143,63 +249,89 @@ class PerformanceTester:
 
     def _perform_load_test_on_endpoint(self, endpoint_info, num_users, duration_seconds):
         logger.info(f"Testing endpoint: {endpoint_info['method']} {endpoint_info['path']} with {num_users} users for {duration_seconds}s")
-        results = []
-        start_test_time = time.time()
-
-        def task():
-            # Construct payload if needed, simplified for this example
-            payload = None
-            if endpoint_info["method"] in ["POST", "PUT"]:
-                # Generic payload, specific tests might need more tailored data
-                payload = {"test_data": "some_value_" + str(uuid.uuid4())[:8]}
-                if "post" in endpoint_info["path"] and "user_id" not in payload:
-                    payload["user_id"] = self.session_data.get("user_id", 1)
-                    payload["title"] = "Perf Test Post"
-                    payload["content"] = "This is a performance test post."
-            
-            # For paths requiring an ID, try to use a common one or a random one for stress
-            path = endpoint_info["path"]
-            if "<int:user_id>" in path:
-                path = path.replace("<int:user_id>", str(self.session_data.get("user_id", 1)))
-            if "<int:post_id>" in path:
-                path = path.replace("<int:post_id>", "1") # Assuming post 1 exists or mock handles it
-            if "<int:conversation_id>" in path:
-                path = path.replace("<int:conversation_id>", "1")
-            if "<int:group_id>" in path:
-                path = path.replace("<int:group_id>", "1")
-            if "<int:module_id>" in path:
-                path = path.replace("<int:module_id>", "1")
-
-            return self._api_request(endpoint_info["method"], path, data=payload)
+        method = endpoint_info["method"]
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=num_users) as executor:
-            futures = []
-            while time.time() - start_test_time < duration_seconds:
-                futures.append(executor.submit(task))
-                time.sleep(1 / (num_users * 2)) # Basic rate limiting to spread requests
-            
-            for future in concurrent.futures.as_completed(futures):
+        # For paths requiring an ID, try to use a common one or a random one for stress
+        path = endpoint_info["path"]
+        if "<int:user_id>" in path:
+            path = path.replace("<int:user_id>", str(self.session_data.get("user_id", 1)))
+        if "<int:post_id>" in path:
+            path = path.replace("<int:post_id>", "1") # Assuming post 1 exists or mock handles it
+        if "<int:conversation_id>" in path:
+            path = path.replace("<int:conversation_id>", "1")
+        if "<int:group_id>" in path:
+            path = path.replace("<int:group_id>", "1")
+        if "<int:module_id>" in path:
+            path = path.replace("<int:module_id>", "1")
+
+        # Construct payload template if needed, simplified for this example
+        payload_template = None
+        if method in ["POST", "PUT"]:
+            # Generic payload, specific tests might need more tailored data
+            payload_template = {"test_data": None}
+            if "post" in endpoint_info["path"]:
+                payload_template["user_id"] = self.session_data.get("user_id", 1)
+                payload_template["title"] = "Perf Test Post"
+                payload_template["content"] = "This is a performance test post."
+
+        # Unique per-request test data; next() on a shared count is atomic under the GIL
+        request_ids = itertools.count()
+
+        def task(payload):
+            if payload is not None:
+                payload["test_data"] = f"some_value_{next(request_ids)}"
+            return self._timed_request(method, path, data=payload)
+
+        def worker(deadline):
+            # Each simulated user issues requests back to back until the deadline.
+            # It owns its payload copy and its result columns, so nothing is shared.
+            payload = dict(payload_template) if payload_template is not None else None
+            status_codes = array("H")
+            latencies = array("d")
+            while time.monotonic() < deadline:
                 try:
-                    results.append(future.result())
+                    status_code, latency, ok = task(payload)
                 except Exception as e:
                     logger.error(f"Task execution error: {e}")
-                    results.append({"status_code": 0, "latency_ms": 0, "error": str(e)})
+                    status_code, ok = 0, False
+                status_codes.append(status_code)
+                if ok:
+                    latencies.append(latency)
+            return status_codes, latencies
+
+        # Results are kept column-wise: every status code, and latencies of requests that completed
+        status_codes = array("H")
+        latencies = array("d")
+        def warm_up(_):
+            # Discarded request that opens this worker's pooled connection before timing starts
+            try:
+                task(dict(payload_template) if payload_template is not None else None)
+            except Exception as e:
+                logger.debug(f"Warm-up request error: {e}")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=num_users) as executor:
+            list(executor.map(warm_up, range(num_users)))
+            deadline = time.monotonic() + duration_seconds
+            for worker_status_codes, worker_latencies in executor.map(worker, [deadline] * num_users):
+                status_codes.extend(worker_status_codes)
+                latencies.extend(worker_latencies)
         
-        latencies = [r["latency_ms"] for r in results if r["error"] is None and r["latency_ms"] is not None]
-        successful_requests = sum(1 for r in results if r["status_code"] >= 200 and r["status_code"] < 300)
-        failed_requests = len(results) - successful_requests
+        total_requests = len(status_codes)
+        successful_requests = sum(1 for status_code in status_codes if 200 <= status_code < 300)
+        failed_requests = total_requests - successful_requests
+        avg_latency, p95_latency, min_latency, max_latency = _latency_stats(latencies)
         
         return {
             "endpoint": f"{endpoint_info['method']} {endpoint_info['path']}",
             "num_users": num_users,
             "duration_seconds": duration_seconds,
-            "total_requests": len(results),
+            "total_requests": total_requests,
             "successful_requests": successful_requests,
             "failed_requests": failed_requests,
-            "avg_latency_ms": statistics.mean(latencies) if latencies else 0,
-            "p95_latency_ms": statistics.quantiles(latencies, n=100)[94] if latencies and len(latencies) > 1 else 0,
-            "min_latency_ms": min(latencies) if latencies else 0,
-            "max_latency_ms": max(latencies) if latencies else 0,
+            "avg_latency_ms": avg_latency,
+            "p95_latency_ms": p95_latency,
+            "min_latency_ms": min_latency,
+            "max_latency_ms": max_latency,
             "rps": successful_requests / duration_seconds if duration_seconds > 0 else 0
         }
 
@@ -228,8 +360,7 @@ class PerformanceTester:
         
         # Filter to use only defined routes if self.routes is populated
         if self.routes:
-            defined_paths_methods = set((r["method"], r["path"]) for r in self.routes)
-            key_endpoints = [ep for ep in key_endpoints if (ep["method"], ep["path"]) in defined_paths_methods or self.mock_mode]
+            key_endpoints = [ep for ep in key_endpoints if (ep["method"], ep["path"]) in self._defined_route_set or self.mock_mode]
         
         if not key_endpoints:
             logger.warning("No key endpoints identified for performance testing based on available routes.")
@@ -237,23 +368,16 @@ class PerformanceTester:
             key_endpoints.append({"method": "GET", "path": "/health", "service": "generic"})
 
         all_results = []
-        load_levels = [
-            {"users": 5, "duration": 10}, # Light load
-            {"users": 20, "duration": 20}, # Moderate load
-            # {"users": 50, "duration": 30}  # Heavy load - uncomment for more intense testing
-        ]
-
         for endpoint in key_endpoints:
             endpoint_results = []
-            for level in load_levels:
+            for level in LOAD_LEVELS:
                 result = self._perform_load_test_on_endpoint(endpoint, level["users"], level["duration"])
                 endpoint_results.append(result)
             all_results.append({"endpoint_group": endpoint["path"], "results_by_load": endpoint_results})
         
         # Save results
         results_file = self.performance_dir / "performance_test_results.json"
-        with open(results_file, 'w') as f:
-            json.dump(all_results, f, indent=2)
+        results_file.write_bytes(_dumps(all_results))
         
         report_file = self._generate_performance_report(all_results)
         
@@ -266,27 +390,32 @@ class PerformanceTester:
 
     def _generate_performance_report(self, all_results):
         report_file = self.performance_dir / "performance_test_report.md"
+        lines = [
+            "# Performance Testing Report\n\n",
+            f"Generated: {datetime.datetime.now().isoformat()}\n",
+            f"Mock Mode: {self.mock_mode}\n\n",
+        ]
+
+        for endpoint_group_result in all_results:
+            lines.append(f"## Endpoint Group: {endpoint_group_result['endpoint_group']}\n\n")
+            lines.append(_REPORT_TABLE_HEADER)
+            lines.extend(
+                f"| {result['num_users']} | {result['duration_seconds']} | {result['total_requests']} | {result['successful_requests']} | {result['failed_requests']} | {result['avg_latency_ms']:.2f} | {result['p95_latency_ms']:.2f} | {result['rps']:.2f} |\n"
+                for result in endpoint_group_result['results_by_load']
+            )
+            lines.append("\n")
+
+        lines.append(_REPORT_RECOMMENDATIONS)
+
         with open(report_file, 'w') as f:
-            f.write("# Performance Testing Report\n\n")
-            f.write(f"Generated: {datetime.datetime.now().isoformat()}\n")
-            f.write(f"Mock Mode: {self.mock_mode}\n\n")
-
-            for endpoint_group_result in all_results:
-                f.write(f"## Endpoint Group: {endpoint_group_result['endpoint_group']}\n\n")
-                f.write("| Concurrent Users | Duration (s) | Total Requests | Successful | Failed | Avg Latency (ms) | P95 Latency (ms) | RPS |\n")
-                f.write("|------------------|--------------|----------------|------------|--------|------------------|------------------|-----|\n")
-                for result in endpoint_group_result['results_by_load']:
-                    f.write(f"| {result['num_users']} | {result['duration_seconds']} | {result['total_requests']} | {result['successful_requests']} | {result['failed_requests']} | {result['avg_latency_ms']:.2f} | {result['p95_latency_ms']:.2f} | {result['rps']:.2f} |\n")
-                f.write("\n")
-            
-            f.write("## Summary & Recommendations\n\n")
-            f.write("- Review endpoints with high latencies or high failure rates under load.\n")
-            f.write("- Consider optimizing database queries and application logic for critical paths.\n")
-            f.write("- Scale resources appropriately based on expected user load.\n")
-            f.write("- If P95 latency is significantly higher than average, investigate outliers and long-tail responses.\n")
+            f.write("".join(lines))
 
         return str(report_file)
 
 if __name__ == "__main__":
-    tester = PerformanceTester()
+    parser = argparse.ArgumentParser(description="FS performance and stress tester")
+    parser.add_argument("--no-mock-latency", action="store_true",
+                        help="in mock mode, return immediately instead of simulating network latency")
+    args = parser.parse_args()
+    tester = PerformanceTester(mock_latency=not args.no_mock_latency)
     tester.run_performance_tests()
@@ -13,6 +13,12 @@ import psutil
 import datetime
 import logging
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # Optional; the stdlib json module is used when it isn't installed
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +31,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger("fs_test_setup")
 
+# Service directories under src/
+_SERVICES = ("user_service", "post_service", "messaging_service", "group_service", "ai_sandbox_service")
+
+def _dumps(obj):
+    """Serialize to indented JSON bytes, preferring orjson when it is available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+def _count_lines(path):
+    """Count the lines of a file from its raw bytes; a final line without a newline still counts"""
+    data = path.read_bytes()
+    return data.count(b"\n") + (1 if data and not data.endswith(b"\n") else 0)
+
 class TestEnvironmentSetup:
     def __init__(self):
         self.project_root = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -60,18 +83,23 @@ class TestEnvironmentSetup:
                 testing_tools = [
                     "pytest", "pytest-cov", "pytest-mock", "pytest-flask", 
                     "locust", "safety", "bandit", "pylint", "flake8",
-                    "coverage", "requests-mock", "pytest-benchmark"
+                    "coverage", "requests-mock", "pytest-benchmark", "orjson"
                 ]
                 subprocess.run([str(pip_path), "install"] + testing_tools, check=True)
                 logger.info(f"Installed testing tools: {', '.join(testing_tools)}")
                 
-                # Install project requirements from each service
-                for service_dir in ["user_service", "post_service", "messaging_service", 
-                                   "group_service", "ai_sandbox_service"]:
-                    req_file = self.project_root / "src" / service_dir / "requirements.txt"
-                    if req_file.exists():
-                        subprocess.run([str(pip_path), "install", "-r", str(req_file)], check=True)
-                        logger.info(f"Installed requirements from {service_dir}")
+                # Install project requirements from every service in one pip run,
+                # so the resolver only runs once
+                req_services = [
+                    service_dir for service_dir in _SERVICES
+                    if (self.project_root / "src" / service_dir / "requirements.txt").exists()
+                ]
+                if req_services:
+                    req_args = []
+                    for service_dir in req_services:
+                        req_args += ["-r", str(self.project_root / "src" / service_dir / "requirements.txt")]
+                    subprocess.run([str(pip_path), "install"] + req_args, check=True)
+                    logger.info(f"Installed requirements from {', '.join(req_services)}")
             except subprocess.CalledProcessError as e:
                 logger.error(f"Failed to create virtual environment: {e}")
                 raise
@@ -96,8 +124,7 @@ class TestEnvironmentSetup:
         
         # Document service dependencies
         dependencies["services"] = {}
-        for service_dir in ["user_service", "post_service", "messaging_service", 
-                           "group_service", "ai_sandbox_service"]:
+        for service_dir in _SERVICES:
             req_file = self.project_root / "src" / service_dir / "requirements.txt"
             if req_file.exists():
                 with open(req_file, 'r') as f:
@@ -114,12 +141,22 @@ class TestEnvironmentSetup:
                 logger.error(f"Failed to get testing dependencies: {e}")
         
         # Save dependencies to file
-        with open(self.dependencies_file, 'w') as f:
-            json.dump(dependencies, f, indent=2)
+        self.dependencies_file.write_bytes(_dumps(dependencies))
         
         logger.info(f"Dependencies documented in {self.dependencies_file}")
         return dependencies
 
+    def _service_metrics(self, service_dir):
+        """Python file and line counts for one service, or None if it doesn't exist"""
+        service_path = self.project_root / "src" / service_dir
+        if not service_path.exists():
+            return None
+        py_files = list(service_path.glob("**/*.py"))
+        return {
+            "python_files": len(py_files),
+            "total_lines": sum(_count_lines(f) for f in py_files),
+        }
+
     def establish_baseline_metrics(self):
         """Establish baseline metrics for the project"""
         logger.info("Establishing baseline metrics...")
@@ -135,16 +172,12 @@ class TestEnvironmentSetup:
             }
         }
         
-        # Count lines of code, files, etc.
-        for service_dir in ["user_service", "post_service", "messaging_service", 
-                           "group_service", "ai_sandbox_service"]:
-            service_path = self.project_root / "src" / service_dir
-            if service_path.exists():
-                py_files = list(service_path.glob("**/*.py"))
-                baseline["code_metrics"][service_dir] = {
-                    "python_files": len(py_files),
-                    "total_lines": sum(1 for f in py_files for _ in open(f)),
-                }
+        # Count lines of code, files, etc.; the services are scanned concurrently
+        with ThreadPoolExecutor(max_workers=len(_SERVICES)) as executor:
+            service_metrics = list(executor.map(self._service_metrics, _SERVICES))
+        for service_dir, metrics in zip(_SERVICES, service_metrics):
+            if metrics is not None:
+                baseline["code_metrics"][service_dir] = metrics
         
         # Count test files and lines
         test_path = self.project_root / "tests"
@@ -152,12 +185,11 @@ class TestEnvironmentSetup:
             test_files = list(test_path.glob("**/*.py"))
             baseline["code_metrics"]["tests"] = {
                 "test_files": len(test_files),
-                "test_lines": sum(1 for f in test_files for _ in open(f)),
+                "test_lines": sum(_count_lines(f) for f in test_files),
             }
         
         # Save baseline metrics to file
-        with open(self.baseline_metrics_file, 'w') as f:
-            json.dump(baseline, f, indent=2)
+        self.baseline_metrics_file.write_bytes(_dumps(baseline))
         
         logger.info(f"Baseline metrics established in {self.baseline_metrics_file}")
         return baseline
@@ -185,8 +217,7 @@ class TestEnvironmentSetup:
         monitoring_dir.mkdir(exist_ok=True)
         
         # Save monitoring configuration
-        with open(self.test_env_dir / "monitoring_config.json", 'w') as f:
-            json.dump(monitoring_config, f, indent=2)
+        (self.test_env_dir / "monitoring_config.json").write_bytes(_dumps(monitoring_config))
         
         logger.info("Monitoring tools configured")
         return monitoring_config
@@ -227,8 +258,7 @@ class TestEnvironmentSetup:
         (self.test_results_dir / "api_calls").mkdir(exist_ok=True)
         
         # Save recording configuration
-        with open(self.test_env_dir / "recording_config.json", 'w') as f:
-            json.dump(recording_config, f, indent=2)
+        (self.test_env_dir / "recording_config.json").write_bytes(_dumps(recording_config))
         
         logger.info("Recording capabilities configured")
         return recording_config
@@ -258,8 +288,7 @@ class TestEnvironmentSetup:
             }
             
             # Save setup summary
-            with open(self.test_env_dir / "setup_summary.json", 'w') as f:
-                json.dump(setup_summary, f, indent=2)
+            (self.test_env_dir / "setup_summary.json").write_bytes(_dumps(setup_summary))
             
             logger.info("Test environment setup completed successfully")
             return setup_summary
@@ -0,0 +1,54 @@
+import unittest
+import importlib.util
+import re
+from pathlib import Path
+
+_MODULE_PATH = Path(__file__).resolve().parents[2] / "testing" / "final_surgical_report.py"
+_spec = importlib.util.spec_from_file_location("final_surgical_report", _MODULE_PATH)
+final_surgical_report = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(final_surgical_report)
+
+KINDS = tuple(final_surgical_report._SECTION_TAGS)
+
+class ExtractSectionsTestCase(unittest.TestCase):
+    def _regex_section(self, content, kind):
+        # The per-kind regex _extract_sections replaced
+        tag = final_surgical_report._SECTION_TAGS[kind]
+        match = re.search(r"(?:^|\n)#{2,3}\s+.*" + re.escape(tag) + r".*?(?:\n#{2,3}|\Z)", content, re.DOTALL)
+        return match.group(0) if match else None
+
+    def _assert_matches_regex(self, content):
+        sections = final_surgical_report._extract_sections(content, *KINDS)
+        for kind in KINDS:
+            with self.subTest(content=content, kind=kind):
+                self.assertEqual(sections[kind], self._regex_section(content, kind))
+
+    def test_heading_at_offset_zero(self):
+        self._assert_matches_regex("## Findings\n- one\n## Metrics\n- two\n")
+        self._assert_matches_regex("### Findings\n- one\n### Metrics")
+
+    def test_four_hash_headings_are_not_headings(self):
+        self._assert_matches_regex("#### Findings\n- one\n")
+        self._assert_matches_regex("intro\n#### Findings\n- one\n## Metrics\n- two")
+        self._assert_matches_regex("## Summary\n#### Findings\n- one\n#### Metrics\n")
+
+    def test_tag_before_first_heading(self):
+        self._assert_matches_regex("Findings first\n## Summary\n- none\n")
+        self._assert_matches_regex("Findings first\n## Summary\n- Findings later\n")
+        self._assert_matches_regex("Recommendations\n## Recommendations\n")
+
+    def test_no_trailing_heading(self):
+        self._assert_matches_regex("intro\n## Findings\n- one\n- two")
+        self._assert_matches_regex("intro\n## Failed Scenarios\n- Failed twice\n")
+
+    def test_heading_requires_whitespace(self):
+        self._assert_matches_regex("##Findings\n- one\n")
+        self._assert_matches_regex("##\nFindings\n## Metrics\n")
+        self._assert_matches_regex("## \n")
+
+    def test_no_headings(self):
+        self._assert_matches_regex("")
+        self._assert_matches_regex("Findings and Metrics without headings")
+
+if __name__ == '__main__':
+    unittest.main()